@@ -20,10 +20,13 @@ import json
 import logging
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, NoReturn, Optional, TextIO, Union
 
+import requests
 from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509 import load_pem_x509_certificate
 from pydantic import ValidationError
@@ -38,7 +41,7 @@ from typing_extensions import TypeAlias
 from sigstore import __version__, dsse
 from sigstore._internal.fulcio.client import ExpiredCertificate
 from sigstore._internal.rekor import _hashedrekord_from_parts
-from sigstore._internal.rekor.client import RekorClient
+from sigstore._internal.rekor.client import RekorClient, _new_rekor_session
 from sigstore._internal.trust import ClientTrustConfig, TrustedRoot
 from sigstore._utils import sha256_digest
 from sigstore.dsse import StatementBuilder, Subject
@@ -100,6 +103,9 @@ VerificationMaterials: TypeAlias = Union[
 # Map of inputs -> outputs for signing operations
 OutputMap: TypeAlias = Dict[Path, SigningOutputs]
 
+# The maximum number of inputs whose verification materials are loaded concurrently
+_MAX_MATERIALS_WORKERS = 8
+
 
 def _fatal(message: str) -> NoReturn:
     """
@@ -1020,8 +1026,31 @@ def _collect_verification_state(
     else:
         verifier = Verifier.production(offline=args.offline)
 
-    all_materials = []
-    for file_or_hashed, materials in input_map.items():
+    # NOTE: `requests` doesn't guarantee that a `Session` is thread-safe, so
+    # each worker thread below talks to Rekor through its own session. These
+    # are collected in `worker_sessions` so that they can be closed once the
+    # workers are done.
+    worker_state = threading.local()
+    worker_sessions: list[requests.Session] = []
+    worker_sessions_lock = threading.Lock()
+
+    def _worker_rekor() -> RekorClient:
+        rekor = getattr(worker_state, "rekor", None)
+        if rekor is None:
+            session = _new_rekor_session()
+            with worker_sessions_lock:
+                worker_sessions.append(session)
+            rekor = verifier._rekor._with_session(session)
+            worker_state.rekor = rekor
+        return rekor
+
+    def _load_materials(
+        item: tuple[Path | Hashed, VerificationMaterials],
+    ) -> tuple[Path | Hashed, Hashed, Bundle | None]:
+        # NOTE: This runs on a worker thread, so it must not report errors
+        # via `_invalid_arguments` (which exits); instead, a missing log
+        # entry is signaled by returning `None` for the bundle.
+        file_or_hashed, materials = item
         if isinstance(file_or_hashed, Path):
             with file_or_hashed.open(mode="rb") as io:
                 hashed = sha256_digest(io)
@@ -1047,19 +1076,42 @@ def _collect_verification_state(
             # When using "detached" materials, we *must* retrieve the log
             # entry from the online log.
             # TODO: This should be abstracted somewhere much better.
-            log_entry = verifier._rekor.log.entries.retrieve.post(
+            log_entry = _worker_rekor().log.entries.retrieve.post(
                 _hashedrekord_from_parts(cert, signature, hashed)
             )
             if log_entry is None:
-                _invalid_arguments(
-                    args,
-                    f"No matching log entry for {file_or_hashed}'s verification materials",
-                )
+                return (file_or_hashed, hashed, None)
             bundle = Bundle.from_parts(cert, signature, log_entry)
 
-        _logger.debug(f"Verifying contents from: {file_or_hashed}")
+        return (file_or_hashed, hashed, bundle)
+
+    # NOTE: Loading each input's materials is dominated by I/O (hashing the
+    # input and, for detached materials, a round-trip to the transparency log),
+    # so we overlap them across a small pool of threads. Results are then
+    # checked here, on the main thread and in input order: `map` yields
+    # results (and re-raises the first failure) in the order of the inputs.
+    all_materials: list[tuple[Path | Hashed, Hashed, Bundle]] = []
+    try:
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_MATERIALS_WORKERS, len(input_map))
+        ) as executor:
+            for file_or_hashed, hashed, maybe_bundle in executor.map(
+                _load_materials, input_map.items()
+            ):
+                if maybe_bundle is None:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    _invalid_arguments(
+                        args,
+                        f"No matching log entry for {file_or_hashed}'s verification materials",
+                    )
 
-        all_materials.append((file_or_hashed, hashed, bundle))
+                _logger.debug(f"Verifying contents from: {file_or_hashed}")
+                all_materials.append((file_or_hashed, hashed, maybe_bundle))
+    finally:
+        # NOTE: The executor has shut down (waiting on its workers) by the
+        # time we get here, so no worker can still be using these.
+        for session in worker_sessions:
+            session.close()
 
     return (verifier, all_materials)
 
@@ -19,8 +19,35 @@ Everything in these APIs is considered internal and unstable, and is not
 subject to any stability guarantees.
 """
 
+import requests
 from requests import __version__ as requests_version
+from requests.adapters import HTTPAdapter
 
 from sigstore import __version__ as sigstore_version
 
 USER_AGENT = f"sigstore-python/{sigstore_version} (python-requests/{requests_version})"
+
+# Connection pool sizing for the sessions returned by `_new_session`:
+# the number of distinct hosts to keep pools for, and the number of
+# kept-alive connections to keep per host.
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 20
+
+
+def _new_session() -> requests.Session:
+    """
+    Returns a new `requests.Session` with sigstore-python's `User-Agent`
+    and a pooled HTTPS adapter.
+
+    `requests` doesn't guarantee that a `Session` is thread-safe, so each
+    client creates its own session by default. Callers that want to reuse
+    kept-alive connections across clients (on a single thread) can pass
+    one session to several clients explicitly.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE),
+    )
+    return session
@@ -34,7 +34,7 @@ from cryptography.x509 import (
     load_pem_x509_certificate,
 )
 
-from sigstore._internal import USER_AGENT
+from sigstore._internal import _new_session
 from sigstore._utils import B64Str
 from sigstore.oidc import IdentityToken
 
@@ -164,22 +164,26 @@ class FulcioTrustBundle(_Endpoint):
 class FulcioClient:
     """The internal Fulcio client"""
 
-    def __init__(self, url: str = DEFAULT_FULCIO_URL) -> None:
-        """Initialize the client"""
+    def __init__(
+        self, url: str = DEFAULT_FULCIO_URL, session: requests.Session | None = None
+    ) -> None:
+        """
+        Initialize the client.
+
+        `session` is the `requests.Session` to perform requests with. If not
+        supplied, the client creates (and owns) a new session.
+        """
         _logger.debug(f"Fulcio client using URL: {url}")
         self.url = url
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": USER_AGENT,
-            }
-        )
+        self._owns_session = session is None
+        self.session = session if session is not None else _new_session()
 
     def __del__(self) -> None:
         """
-        Destroys the underlying network session.
+        Destroys the underlying network session, if this client created it.
         """
-        self.session.close()
+        if self._owns_session:
+            self.session.close()
 
     @classmethod
     def production(cls) -> FulcioClient:
@@ -25,7 +25,6 @@ from __future__ import annotations
 
 import base64
 import hashlib
-import struct
 import typing
 from typing import List, Tuple
 
@@ -39,6 +38,12 @@ if typing.TYPE_CHECKING:
 _LEAF_HASH_PREFIX = 0
 _NODE_HASH_PREFIX = 1
 
+# NOTE: Every leaf and node hash begins with the same one-byte domain
+# separator, so we absorb it once and `copy()` the resulting SHA256 state
+# per hash rather than packing a fresh prefixed buffer each time.
+_LEAF_HASHER = hashlib.sha256(bytes([_LEAF_HASH_PREFIX]))
+_NODE_HASHER = hashlib.sha256(bytes([_NODE_HASH_PREFIX]))
+
 
 def _decomp_inclusion_proof(index: int, size: int) -> Tuple[int, int]:
     """
@@ -83,15 +88,16 @@ def _chain_border_right(seed: bytes, hashes: List[str]) -> bytes:
 
 
 def _hash_children(lhs: bytes, rhs: bytes) -> bytes:
-    pattern = f"B{len(lhs)}s{len(rhs)}s"
-    data = struct.pack(pattern, _NODE_HASH_PREFIX, lhs, rhs)
-    return hashlib.sha256(data).digest()
+    hasher = _NODE_HASHER.copy()
+    hasher.update(lhs)
+    hasher.update(rhs)
+    return hasher.digest()
 
 
 def _hash_leaf(leaf: bytes) -> bytes:
-    pattern = f"B{len(leaf)}s"
-    data = struct.pack(pattern, _LEAF_HASH_PREFIX, leaf)
-    return hashlib.sha256(data).digest()
+    hasher = _LEAF_HASHER.copy()
+    hasher.update(leaf)
+    return hasher.digest()
 
 
 def verify_merkle_inclusion(entry: LogEntry) -> None:
@@ -18,6 +18,7 @@ Client implementation for interacting with Rekor.
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 from abc import ABC
@@ -28,7 +29,7 @@ from urllib.parse import urljoin
 import rekor_types
 import requests
 
-from sigstore._internal import USER_AGENT
+from sigstore._internal import _new_session
 from sigstore.models import LogEntry
 
 _logger = logging.getLogger(__name__)
@@ -37,6 +38,20 @@ DEFAULT_REKOR_URL = "https://rekor.sigstore.dev"
 STAGING_REKOR_URL = "https://rekor.sigstage.dev"
 
 
+def _new_rekor_session() -> requests.Session:
+    """
+    Returns a new session for talking to Rekor's JSON API.
+    """
+    session = _new_session()
+    session.headers.update(
+        {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+    )
+    return session
+
+
 @dataclass(frozen=True)
 class RekorLogInfo:
     """
@@ -153,7 +168,10 @@ class RekorEntries(_Endpoint):
         """
 
         payload = proposed_entry.model_dump(mode="json", by_alias=True)
-        _logger.debug(f"proposed: {json.dumps(payload)}")
+        # NOTE: Avoid re-serializing the (potentially large) proposed entry
+        # just to throw the result away when debug logging is disabled.
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(f"proposed: {json.dumps(payload)}")
 
         resp: requests.Response = self.session.post(self.url, json=payload)
         try:
@@ -222,25 +240,34 @@ class RekorEntriesRetrieve(_Endpoint):
 class RekorClient:
     """The internal Rekor client"""
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, session: requests.Session | None = None) -> None:
         """
         Create a new `RekorClient` from the given URL.
+
+        `session` is the `requests.Session` to perform requests with. If not
+        supplied, the client creates (and owns) a new session.
         """
         self.url = urljoin(url, "api/v1/")
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "User-Agent": USER_AGENT,
-            }
-        )
+        self._owns_session = session is None
+        self.session = session if session is not None else _new_rekor_session()
 
     def __del__(self) -> None:
         """
-        Terminates the underlying network session.
+        Terminates the underlying network session, if this client created it.
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def _with_session(self, session: requests.Session) -> RekorClient:
+        """
+        Returns a copy of this client that performs requests with `session`.
+
+        The caller remains responsible for closing `session`.
         """
-        self.session.close()
+        client = copy.copy(self)
+        client.session = session
+        client._owns_session = False
+        return client
 
     @classmethod
     def production(cls) -> RekorClient:
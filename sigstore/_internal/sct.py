@@ -18,7 +18,7 @@ Utilities for verifying signed certificate timestamps.
 
 import logging
 import struct
-from datetime import timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 from cryptography.hazmat.primitives import hashes, serialization
@@ -46,15 +46,26 @@ from sigstore.errors import VerificationError
 _logger = logging.getLogger(__name__)
 
 
-def _pack_signed_entry(
+# The fixed-size portions of the "digitally-signed" struct, before and
+# after the variable-length `signed_entry`.
+_DIGITALLY_SIGNED_HEADER = struct.Struct("!BBQH")
+_DIGITALLY_SIGNED_TRAILER = struct.Struct("!H")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _signed_entry_fields(
     sct: SignedCertificateTimestamp, cert: Certificate, issuer_key_id: Optional[bytes]
-) -> bytes:
+) -> List[bytes]:
+    """
+    Returns the wire-format pieces of the `signed_entry` field, unjoined so
+    that the caller can splice them directly into the final blob.
+    """
     fields = []
     if sct.entry_type == LogEntryType.X509_CERTIFICATE:
         # When dealing with a "normal" certificate, our signed entry looks like this:
         #
         # [0]: opaque ASN.1Cert<1..2^24-1>
-        pack_format = "!BBB{cert_der_len}s"
         cert_der = cert.public_bytes(encoding=serialization.Encoding.DER)
     elif sct.entry_type == LogEntryType.PRE_CERTIFICATE:
         if not issuer_key_id or len(issuer_key_id) != 32:
@@ -64,7 +75,6 @@ def _pack_signed_entry(
         #
         # [0]: issuer_key_id[32]
         # [1]: opaque TBSCertificate<1..2^24-1>
-        pack_format = "!32sBBB{cert_der_len}s"
 
         # Precertificates must have their SCT list extension filtered out.
         cert_der = cert.tbs_precertificate_bytes
@@ -73,20 +83,14 @@ def _pack_signed_entry(
         raise VerificationError(f"unknown SCT log entry type: {sct.entry_type!r}")
 
     # The `opaque` length is a u24, which isn't directly supported by `struct`.
-    # So we have to decompose it into 3 bytes.
-    unused, len1, len2, len3 = struct.unpack(
-        "!4B",
-        struct.pack("!I", len(cert_der)),
-    )
-    if unused:
+    if len(cert_der) >= 1 << 24:
         raise VerificationError(
             f"Unexpectedly large certificate length: {len(cert_der)}"
         )
 
-    pack_format = pack_format.format(cert_der_len=len(cert_der))
-    fields.extend((len1, len2, len3, cert_der))
+    fields.extend((len(cert_der).to_bytes(3, "big"), cert_der))
 
-    return struct.pack(pack_format, *fields)
+    return fields
 
 
 def _pack_digitally_signed(
@@ -110,25 +114,29 @@ def _pack_digitally_signed(
     # This constructs the "core" `signed_entry` field, which is either
     # the public bytes of the cert *or* the TBSPrecertificate (with some
     # filtering), depending on whether our SCT is for a precertificate.
-    signed_entry = _pack_signed_entry(sct, cert, issuer_key_id)
+    signed_entry = _signed_entry_fields(sct, cert, issuer_key_id)
 
-    # Assemble a format string with the certificate length baked in and then pack the digitally
-    # signed data
+    # Pack the fixed-size fields around the variable-length signed entry.
     # fmt: off
-    pattern = "!BBQH%dsH" % len(signed_entry)
+    # NOTE: The SCT's timestamp is in milliseconds since the epoch; we compute it
+    # with integer arithmetic, since a float round-trip can be off by one.
     timestamp = sct.timestamp.replace(tzinfo=timezone.utc)
-    data = struct.pack(
-        pattern,
+    timestamp_ms = (timestamp - _EPOCH) // timedelta(milliseconds=1)
+    header = _DIGITALLY_SIGNED_HEADER.pack(
         sct.version.value,                  # sct_version
         0,                                  # signature_type (certificate_timestamp(0))
-        int(timestamp.timestamp() * 1000),  # timestamp (milliseconds)
+        timestamp_ms,                       # timestamp (milliseconds)
         sct.entry_type.value,               # entry_type (x509_entry(0) | precert_entry(1))
-        signed_entry,                       # select(entry_type) -> signed_entry (see above)
+    )
+    trailer = _DIGITALLY_SIGNED_TRAILER.pack(
         len(sct.extension_bytes),           # extensions (opaque CtExtensions<0..2^16-1>)
     )
     # fmt: on
 
-    return data
+    # select(entry_type) -> signed_entry (see above)
+    # NOTE: Joining every piece at once sizes the output up front and copies
+    # the (multi-KiB) certificate body exactly once.
+    return b"".join((header, *signed_entry, trailer))
 
 
 def _is_preissuer(issuer: Certificate) -> bool:
@@ -116,6 +116,9 @@ class Key:
             raise VerificationError("public key is empty")
 
         hash_algorithm: hashes.HashAlgorithm
+        # NOTE: For EC keys, the signature algorithm is constructed once here,
+        # rather than on every `verify` call.
+        self._ecdsa: ec.ECDSA | None = None
         if public_key.key_details in self._RSA_SHA_256_DETAILS:
             hash_algorithm = hashes.SHA256()
             key = load_der_public_key(public_key.raw_bytes, types=(rsa.RSAPublicKey,))
@@ -124,6 +127,7 @@ class Key:
             key = load_der_public_key(
                 public_key.raw_bytes, types=(ec.EllipticCurvePublicKey,)
             )
+            self._ecdsa = ec.ECDSA(hash_algorithm)
         else:
             raise VerificationError(f"unsupported key type: {public_key.key_details}")
 
@@ -147,7 +151,8 @@ class Key:
             self.key.verify(
                 signature=signature,
                 data=data,
-                signature_algorithm=ec.ECDSA(self.hash_algorithm),
+                # NOTE: Always set for EC keys; see `__init__`.
+                signature_algorithm=self._ecdsa,  # type: ignore[arg-type]
             )
         else:
             # Unreachable without API misuse.
@@ -34,6 +34,9 @@ from sigstore.hashes import Hashed
 
 _logger = logging.getLogger(__name__)
 
+# DSSE envelopes are always signed with ECDSA over SHA256.
+_ECDSA_SHA256 = ec.ECDSA(hashes.SHA256())
+
 Digest = Union[
     Literal["sha256"],
     Literal["sha384"],
@@ -274,7 +277,7 @@ def _sign(key: ec.EllipticCurvePrivateKey, stmt: Statement) -> Envelope:
     pae = stmt._pae()
     _logger.debug(f"DSSE PAE: {pae!r}")
 
-    signature = key.sign(pae, ec.ECDSA(hashes.SHA256()))
+    signature = key.sign(pae, _ECDSA_SHA256)
     return Envelope(
         _Envelope(
             payload=stmt._contents,
@@ -301,7 +304,7 @@ def _verify(key: ec.EllipticCurvePublicKey, evp: Envelope) -> bytes:
     signature = evp._inner.signatures[0].sig
 
     try:
-        key.verify(signature, pae, ec.ECDSA(hashes.SHA256()))
+        key.verify(signature, pae, _ECDSA_SHA256)
     except InvalidSignature:
         raise VerificationError("DSSE: invalid signature")
 
@@ -24,6 +24,8 @@ from sigstore_protobuf_specs.dev.sigstore.common.v1 import HashAlgorithm
 
 from sigstore.errors import Error
 
+_PREHASHED_SHA256 = Prehashed(hashes.SHA256())
+
 
 class Hashed(BaseModel, frozen=True):
     """
@@ -53,7 +55,7 @@ class Hashed(BaseModel, frozen=True):
         Returns an appropriate Cryptography `Prehashed` for this `Hashed`.
         """
         if self.algorithm == HashAlgorithm.SHA2_256:
-            return Prehashed(hashes.SHA256())
+            return _PREHASHED_SHA256
         raise Error(f"unknown hash algorithm: {self.algorithm}")
 
     def __str__(self) -> str:
@@ -19,9 +19,11 @@ Common models shared between signing and verification.
 from __future__ import annotations
 
 import base64
+import hashlib
 import logging
 import typing
 from enum import Enum
+from functools import cached_property
 from textwrap import dedent
 from typing import Any, List, Optional
 
@@ -281,6 +283,16 @@ class LogEntry:
         This encoded representation is suitable for verification against
         the Signed Entry Timestamp.
         """
+        return self._canonical
+
+    @cached_property
+    def _canonical(self) -> bytes:
+        """
+        The memoized result of `encode_canonical`. Log entries are immutable,
+        so the canonical encoding only needs to be computed once.
+
+        @private
+        """
         payload: dict[str, int | str] = {
             "body": self.body,
             "integratedTime": self.integrated_time,
@@ -290,6 +302,29 @@ class LogEntry:
 
         return rfc8785.dumps(payload)
 
+    def _digest(self) -> bytes:
+        """
+        Returns a SHA256 digest over every verifiable component of this
+        log entry, including its inclusion proof and promise.
+
+        Two entries with the same digest are indistinguishable for the
+        purposes of `_verify`.
+
+        @private
+        """
+        payload: dict[str, Any] = {
+            "body": self.body,
+            "integratedTime": self.integrated_time,
+            "logID": self.log_id,
+            "logIndex": self.log_index,
+            "inclusionProof": self.inclusion_proof.model_dump(
+                mode="json", by_alias=True
+            ),
+            "inclusionPromise": self.inclusion_promise,
+        }
+
+        return hashlib.sha256(rfc8785.dumps(payload)).digest()
+
     def _verify_set(self, keyring: RekorKeyring) -> None:
         """
         Verify the inclusion promise (Signed Entry Timestamp) for a given transparency log
@@ -21,7 +21,8 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Protocol
+from functools import lru_cache
+from typing import FrozenSet, Protocol
 
 from cryptography.x509 import (
     Certificate,
@@ -33,6 +34,7 @@ from cryptography.x509 import (
     UniformResourceIdentifier,
 )
 from pyasn1.codec.der.decoder import decode as der_decode
+from pyasn1.codec.der.encoder import encode as der_encode
 from pyasn1.type.char import UTF8String
 
 from sigstore.errors import VerificationError
@@ -66,6 +68,39 @@ _OIDC_RUN_INVOCATION_URI_OID = ObjectIdentifier("1.3.6.1.4.1.57264.1.21")
 _OIDC_SOURCE_REPOSITORY_VISIBILITY_OID = ObjectIdentifier("1.3.6.1.4.1.57264.1.22")
 
 
+@lru_cache(maxsize=64)
+def _subject_alternative_names(cert: Certificate) -> FrozenSet[str]:
+    """
+    Returns the set of all identities in `cert`'s SAN extension that
+    `Identity` can match against: emails, URIs, and Sigstore-specific
+    "other names".
+
+    Raises `VerificationError` if `cert` has no SAN extension.
+
+    Policies commonly check the same certificate many times over (e.g. as
+    children of `AnyOf` or `AllOf`), so this set is only built once per
+    certificate. The cache is process-wide, and keeps up to 64 of the most
+    recently inspected certificates alive for the life of the process.
+    """
+    try:
+        san_ext = cert.extensions.get_extension_for_class(SubjectAlternativeName).value
+    except ExtensionNotFound:
+        raise VerificationError(
+            "Certificate does not contain SubjectAlternativeName extension"
+        )
+
+    all_sans = set(san_ext.get_values_for_type(RFC822Name))
+    all_sans.update(san_ext.get_values_for_type(UniformResourceIdentifier))
+    all_sans.update(
+        [
+            on.value.decode()
+            for on in san_ext.get_values_for_type(OtherName)
+            if on.type_id == _OTHERNAME_OID
+        ]
+    )
+    return frozenset(all_sans)
+
+
 class _SingleX509ExtPolicy(ABC):
     """
     An ABC for verification policies that boil down to checking a single
@@ -83,12 +118,23 @@ class _SingleX509ExtPolicy(ABC):
         verification.
         """
         self._value = value
+        self._raw_value = self._encode(value)
 
-    def verify(self, cert: Certificate) -> None:
+    @staticmethod
+    def _encode(value: str) -> bytes:
         """
-        Verify this policy against `cert`.
+        Encodes `value` as it would appear as this policy's raw extension value.
 
-        Raises `VerificationError` on failure.
+        The encoding is computed once, so that checking a certificate is a
+        plain comparison of raw extension bytes.
+        """
+        return value.encode()
+
+    def _raw_extension_value(self, cert: Certificate) -> bytes:
+        """
+        Returns the raw (undecoded) value of this policy's extension in `cert`.
+
+        Raises `VerificationError` if `cert` does not contain the extension.
         """
         try:
             ext = cert.extensions.get_extension_for_oid(self.oid).value
@@ -102,8 +148,17 @@ class _SingleX509ExtPolicy(ABC):
 
         # NOTE(ww): mypy is confused by the `Extension[ExtensionType]` returned
         # by `get_extension_for_oid` above.
-        ext_value = ext.value.decode()  # type: ignore[attr-defined]
-        if ext_value != self._value:
+        return ext.value  # type: ignore[attr-defined,no-any-return]
+
+    def verify(self, cert: Certificate) -> None:
+        """
+        Verify this policy against `cert`.
+
+        Raises `VerificationError` on failure.
+        """
+        raw_value = self._raw_extension_value(cert)
+        if raw_value != self._raw_value:
+            ext_value = raw_value.decode()
             raise VerificationError(
                 (
                     f"Certificate's {self.__class__.__name__} does not match "
@@ -119,26 +174,22 @@ class _SingleX509ExtPolicyV2(_SingleX509ExtPolicy):
     the ASN.1 tag is UTF8String (0x0C) and the tag class is universal.
     """
 
+    @staticmethod
+    def _encode(value: str) -> bytes:
+        # NOTE: DER encodings are unique, so comparing against the encoded
+        # expected value is equivalent to decoding the extension, and
+        # avoids a (relatively slow) pyasn1 decode on the success path.
+        return der_encode(UTF8String(value))  # type: ignore[no-any-return]
+
     def verify(self, cert: Certificate) -> None:
         """
         Verify this policy against `cert`.
 
         Raises `VerificationError` on failure.
         """
-        try:
-            ext = cert.extensions.get_extension_for_oid(self.oid).value
-        except ExtensionNotFound:
-            raise VerificationError(
-                (
-                    f"Certificate does not contain {self.__class__.__name__} "
-                    f"({self.oid.dotted_string}) extension"
-                )
-            )
-
-        # NOTE(ww): mypy is confused by the `Extension[ExtensionType]` returned
-        # by `get_extension_for_oid` above.
-        ext_value = der_decode(ext.value, UTF8String)[0].decode()  # type: ignore[attr-defined]
-        if ext_value != self._value:
+        raw_value = self._raw_extension_value(cert)
+        if raw_value != self._raw_value:
+            ext_value = der_decode(raw_value, UTF8String)[0].decode()
             raise VerificationError(
                 (
                     f"Certificate's {self.__class__.__name__} does not match "
@@ -355,6 +406,26 @@ class VerificationPolicy(Protocol):
         raise NotImplementedError  # pragma: no cover
 
 
+def _flatten(
+    kind: type[AnyOf | AllOf], children: list[VerificationPolicy]
+) -> list[VerificationPolicy]:
+    """
+    Splices the children of any `kind` policies in `children` into a single
+    list, since OR (and AND) are associative: `AnyOf([AnyOf([a, b]), c])` is
+    equivalent to `AnyOf([a, b, c])`, but needs fewer calls to verify.
+
+    Empty nested policies are kept as-is, since they're trivially invalid.
+    Subclasses of `kind` are also kept as-is, since they may override `verify`.
+    """
+    flattened: list[VerificationPolicy] = []
+    for child in children:
+        if type(child) is kind and child._children:
+            flattened.extend(child._children)
+        else:
+            flattened.append(child)
+    return flattened
+
+
 class AnyOf:
     """
     The "any of" policy, corresponding to a logical OR between child policies.
@@ -362,11 +433,18 @@ class AnyOf:
     An empty list of child policies is considered trivially invalid.
     """
 
+    __slots__ = ("_children", "_failure_reason", "__weakref__")
+
     def __init__(self, children: list[VerificationPolicy]):
         """
         Create a new `AnyOf`, with the given child policies.
+
+        Directly nested `AnyOf` children are flattened into this policy.
         """
-        self._children = children
+        self._children = _flatten(AnyOf, children)
+        # NOTE: `AnyOf` only fails when every child has, so its failure
+        # reason is fixed once the children are.
+        self._failure_reason = f"0 of {len(self._children)} policies succeeded"
 
     def verify(self, cert: Certificate) -> None:
         """
@@ -383,7 +461,7 @@ class AnyOf:
             else:
                 return
 
-        raise VerificationError(f"0 of {len(self._children)} policies succeeded")
+        raise VerificationError(self._failure_reason)
 
 
 class AllOf:
@@ -394,12 +472,16 @@ class AllOf:
     An empty list of child policies is considered trivially invalid.
     """
 
+    __slots__ = ("_children", "__weakref__")
+
     def __init__(self, children: list[VerificationPolicy]):
         """
         Create a new `AllOf`, with the given child policies.
+
+        Directly nested `AllOf` children are flattened into this policy.
         """
 
-        self._children = children
+        self._children = _flatten(AllOf, children)
 
     def verify(self, cert: Certificate) -> None:
         """
@@ -448,6 +530,8 @@ class Identity:
     Supported SAN types include emails, URIs, and Sigstore-specific "other names".
     """
 
+    __slots__ = ("_identity", "_issuer", "__weakref__")
+
     _issuer: OIDCIssuer | None
 
     def __init__(self, *, identity: str, issuer: str | None = None):
@@ -469,20 +553,10 @@ class Identity:
         if self._issuer:
             self._issuer.verify(cert)
 
-        # Build a set of all valid identities.
-        san_ext = cert.extensions.get_extension_for_class(SubjectAlternativeName).value
-        all_sans = set(san_ext.get_values_for_type(RFC822Name))
-        all_sans.update(san_ext.get_values_for_type(UniformResourceIdentifier))
-        all_sans.update(
-            [
-                on.value.decode()
-                for on in san_ext.get_values_for_type(OtherName)
-                if on.type_id == _OTHERNAME_OID
-            ]
-        )
+        all_sans = _subject_alternative_names(cert)
 
         verified = self._identity in all_sans
         if not verified:
             raise VerificationError(
-                f"Certificate's SANs do not match {self._identity}; actual SANs: {all_sans}"
+                f"Certificate's SANs do not match {self._identity}; actual SANs: {set(all_sans)}"
             )
@@ -19,14 +19,17 @@ Verification API machinery.
 from __future__ import annotations
 
 import base64
+import hashlib
 import logging
+import threading
 from datetime import datetime, timezone
-from typing import List, cast
+from typing import IO, List, cast
 
 import rekor_types
 from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import ec
-from cryptography.x509 import ExtendedKeyUsage, KeyUsage
+from cryptography.x509 import Certificate, ExtendedKeyUsage, KeyUsage
 from cryptography.x509.oid import ExtendedKeyUsageOID
 from OpenSSL.crypto import (
     X509,
@@ -50,7 +53,7 @@ from sigstore._internal.trust import ClientTrustConfig, KeyringPurpose, TrustedR
 from sigstore._utils import base64_encode_pem_cert, sha256_digest
 from sigstore.errors import VerificationError
 from sigstore.hashes import Hashed
-from sigstore.models import Bundle
+from sigstore.models import Bundle, LogEntry
 from sigstore.verify.policy import VerificationPolicy
 
 _logger = logging.getLogger(__name__)
@@ -63,6 +66,10 @@ MAX_ALLOWED_TIMESTAMP: int = 32
 # timestamps to consider a signature valid.
 VERIFY_TIMESTAMP_THRESHOLD: int = 1
 
+# The maximum number of successfully verified log entries (and SCTs)
+# remembered by each `Verifier`, to avoid re-verifying them across calls.
+_MAX_VERIFIED_LOG_ENTRIES: int = 1024
+
 
 class Verifier:
     """
@@ -84,7 +91,17 @@ class Verifier:
             X509.from_cryptography(parent_cert)
             for parent_cert in trusted_root.get_fulcio_certs()
         ]
+        # NOTE: Loading a keyring parses each of its public keys, so we
+        # do it once here rather than on every verification.
+        self._ct_keyring = trusted_root.ct_keyring(KeyringPurpose.VERIFY)
+        self._rekor_keyring = trusted_root.rekor_keyring(KeyringPurpose.VERIFY)
         self._trusted_root = trusted_root
+        # NOTE: These are used as insertion-ordered sets of digests;
+        # see `_remember`. A `Verifier` may be shared between threads,
+        # so they're only ever accessed under `_verified_lock`.
+        self._verified_lock = threading.Lock()
+        self._verified_log_entries: dict[bytes, None] = {}
+        self._verified_scts: dict[bytes, None] = {}
 
     @classmethod
     def production(cls, *, offline: bool = False) -> Verifier:
@@ -280,6 +297,73 @@ class Verifier:
         except X509StoreContextError as e:
             raise VerificationError(f"failed to build chain: {e}")
 
+    def _remembered(self, verified: dict[bytes, None], digest: bytes) -> bool:
+        """
+        Returns whether `digest` is in the bounded set `verified`.
+        """
+        with self._verified_lock:
+            return digest in verified
+
+    def _remember(self, verified: dict[bytes, None], digest: bytes) -> None:
+        """
+        Records `digest` in the bounded, insertion-ordered set `verified`,
+        evicting the oldest digest if the set is full.
+        """
+        with self._verified_lock:
+            if digest in verified:
+                return
+            if len(verified) >= _MAX_VERIFIED_LOG_ENTRIES:
+                del verified[next(iter(verified))]
+            verified[digest] = None
+
+    def _verify_log_entry(self, entry: LogEntry) -> None:
+        """
+        Verify the inclusion proof, signed checkpoint and (if present)
+        inclusion promise for the given log entry.
+
+        Log entries are immutable, so entries that have already been
+        successfully verified by this `Verifier` are not verified again.
+
+        Raises a VerificationError on failure.
+        """
+        digest = entry._digest()
+        if self._remembered(self._verified_log_entries, digest):
+            _logger.debug(f"log entry already verified: index={entry.log_index}")
+            return
+
+        try:
+            entry._verify(self._rekor_keyring)
+        except VerificationError as exc:
+            raise VerificationError(f"invalid log entry: {exc}")
+
+        self._remember(self._verified_log_entries, digest)
+
+    def _verify_sct(self, cert: Certificate, chain: List[Certificate]) -> None:
+        """
+        Verify the SCT embedded in the given signing certificate, against
+        the given (verified) certificate chain.
+
+        Signers commonly reuse a single signing certificate for many
+        artifacts, so certificates whose SCT has already been successfully
+        verified against the same chain by this `Verifier` are not verified
+        again.
+
+        Raises a VerificationError on failure.
+        """
+        digest = hashlib.sha256(
+            b"".join(c.fingerprint(hashes.SHA256()) for c in [cert, *chain])
+        ).digest()
+        if self._remembered(self._verified_scts, digest):
+            _logger.debug("SCT already verified for signing certificate")
+            return
+
+        try:
+            verify_sct(cert, chain, self._ct_keyring)
+        except VerificationError as e:
+            raise VerificationError(f"failed to verify SCT on signing certificate: {e}")
+
+        self._remember(self._verified_scts, digest)
+
     def _verify_common_signing_cert(
         self, bundle: Bundle, policy: VerificationPolicy
     ) -> None:
@@ -314,19 +398,6 @@ class Verifier:
 
         cert = bundle.signing_certificate
 
-        # NOTE: The `X509Store` object currently cannot have its time reset once the `set_time`
-        # method been called on it. To get around this, we construct a new one for every `verify`
-        # call.
-        store = X509Store()
-        # NOTE: By explicitly setting the flags here, we ensure that OpenSSL's
-        # PARTIAL_CHAIN default does not change on us. Enabling PARTIAL_CHAIN
-        # would be strictly more conformant of OpenSSL, but we currently
-        # *want* the "long" chain behavior of performing path validation
-        # down to a self-signed root.
-        store.set_flags(X509StoreFlags.X509_STRICT)
-        for parent_cert_ossl in self._fulcio_certificate_chain:
-            store.add_cert(parent_cert_ossl)
-
         # (0): Establishing a Time for the Signature
         # First, establish a time for the signature. This timestamp is required to
         # validate the certificate chain, so this step comes first.
@@ -340,20 +411,16 @@ class Verifier:
         # (1): verify that the signing certificate is signed by the root
         #      certificate and that the signing certificate was valid at the
         #      time of signing.
+        # NOTE: The trusted Fulcio certificates are converted to pyOpenSSL
+        # once, when the `Verifier` is constructed; only the signing
+        # certificate needs converting here.
         cert_ossl = X509.from_cryptography(cert)
         chain: list[X509] = []
         for vts in verified_timestamps:
             chain = self._verify_chain_at_time(cert_ossl, vts)
 
         # (2): verify the signing certificate's SCT.
-        try:
-            verify_sct(
-                cert,
-                [parent_cert.to_cryptography() for parent_cert in chain],
-                self._trusted_root.ct_keyring(KeyringPurpose.VERIFY),
-            )
-        except VerificationError as e:
-            raise VerificationError(f"failed to verify SCT on signing certificate: {e}")
+        self._verify_sct(cert, [parent_cert.to_cryptography() for parent_cert in chain])
 
         # (3): verify the signing certificate against the Sigstore
         #      X.509 profile and verify against the given `VerificationPolicy`.
@@ -373,10 +440,7 @@ class Verifier:
         #      log entry.
         # (5): verify the inclusion promise for the log entry, if present.
         entry = bundle.log_entry
-        try:
-            entry._verify(self._trusted_root.rekor_keyring(KeyringPurpose.VERIFY))
-        except VerificationError as exc:
-            raise VerificationError(f"invalid log entry: {exc}")
+        self._verify_log_entry(entry)
 
         # (6): verify that log entry was integrated circa the signing certificate's
         #      validity period.
@@ -470,15 +534,17 @@ class Verifier:
 
     def verify_artifact(
         self,
-        input_: bytes | Hashed,
+        input_: bytes | IO[bytes] | Hashed,
         bundle: Bundle,
         policy: VerificationPolicy,
     ) -> None:
         """
         Public API for verifying.
 
-        `input_` is the input to verify, either as a buffer of contents or as
-        a prehashed `Hashed` object.
+        `input_` is the input to verify, either as a buffer of contents,
+        a binary stream of contents, or as a prehashed `Hashed` object.
+        Streams are digested incrementally and are never fully buffered
+        into memory, making them suitable for arbitrarily large inputs.
 
         `bundle` is the Sigstore `Bundle` to verify against.
 
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import base64
+import functools
 import os
 import re
 from collections import defaultdict
@@ -112,6 +113,13 @@ def signing_materials(asset) -> Callable[[str, RekorClient], tuple[Path, Bundle]
     return _signing_materials
 
 
+@functools.lru_cache
+def _load_bundle(bundle_path: Path) -> Bundle:
+    # NOTE: Bundles are only ever read by the tests that use `signing_bundle`,
+    # so each asset is parsed once and shared between them.
+    return Bundle.from_json(bundle_path.read_bytes())
+
+
 @pytest.fixture
 def signing_bundle(asset):
     def _signing_bundle(name: str) -> tuple[Path, Bundle]:
@@ -119,7 +127,7 @@ def signing_bundle(asset):
         bundle_path = asset(f"{name}.sigstore")
         if not bundle_path.is_file():
             bundle_path = asset(f"{name}.sigstore.json")
-        bundle = Bundle.from_json(bundle_path.read_bytes())
+        bundle = _load_bundle(bundle_path)
 
         return (file, bundle)
 
@@ -12,3 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+
+import pretend
+
+from sigstore._internal.fulcio import client
+
+
+def test_fulcio_client_owns_default_session():
+    production, staging = (
+        client.FulcioClient.production(),
+        client.FulcioClient.staging(),
+    )
+    assert production.session is not staging.session
+    assert production._owns_session and staging._owns_session
+
+
+def test_fulcio_client_explicit_session():
+    session = pretend.stub()
+    fulcio = client.FulcioClient(session=session)
+    assert fulcio.session is session
+    assert not fulcio._owns_session
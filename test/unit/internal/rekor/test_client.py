@@ -0,0 +1,41 @@
+# Copyright 2022 The Sigstore Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pretend
+
+from sigstore._internal.rekor import client
+
+
+def test_rekor_client_owns_default_session():
+    production, staging = client.RekorClient.production(), client.RekorClient.staging()
+    assert production.session is not staging.session
+    assert production._owns_session and staging._owns_session
+
+
+def test_rekor_client_explicit_session():
+    session = pretend.stub()
+    rekor = client.RekorClient(client.DEFAULT_REKOR_URL, session=session)
+    assert rekor.session is session
+    assert not rekor._owns_session
+
+
+def test_rekor_client_with_session():
+    rekor = client.RekorClient.staging()
+    session = pretend.stub()
+    other = rekor._with_session(session)
+
+    assert other.url == rekor.url
+    assert other.session is session
+    assert not other._owns_session
+    assert rekor._owns_session
@@ -20,6 +20,7 @@ import pytest
 from cryptography.x509.certificate_transparency import LogEntryType
 
 from sigstore._internal import sct
+from sigstore.errors import VerificationError
 
 
 @pytest.mark.parametrize(
@@ -61,3 +62,37 @@ def test_pack_digitally_signed_precertificate(precert_bytes_len):
         + b"\x00\x00"  # extensions length
         + b""  # extensions
     )
+
+
+def test_pack_digitally_signed_precertificate_too_large():
+    mock_sct = pretend.stub(
+        version=pretend.stub(value=0),
+        timestamp=datetime.datetime.fromtimestamp(
+            1234 / 1000.0, tz=datetime.timezone.utc
+        ),
+        entry_type=LogEntryType.PRE_CERTIFICATE,
+        extension_bytes=b"",
+    )
+    cert = pretend.stub(tbs_precertificate_bytes=b"x" * (1 << 24))
+    issuer_key_hash = b"iamapublickeyshatwofivesixdigest"
+
+    with pytest.raises(VerificationError, match="Unexpectedly large certificate"):
+        sct._pack_digitally_signed(mock_sct, cert, issuer_key_hash)
+
+
+def test_pack_digitally_signed_timestamp_precision():
+    # This timestamp is not exactly representable after a round-trip through
+    # a float number of seconds.
+    timestamp_ms = 8728402731755
+    mock_sct = pretend.stub(
+        version=pretend.stub(value=0),
+        timestamp=datetime.datetime(1970, 1, 1)
+        + datetime.timedelta(milliseconds=timestamp_ms),
+        entry_type=LogEntryType.PRE_CERTIFICATE,
+        extension_bytes=b"",
+    )
+    cert = pretend.stub(tbs_precertificate_bytes=b"x")
+    issuer_key_hash = b"iamapublickeyshatwofivesixdigest"
+
+    data = sct._pack_digitally_signed(mock_sct, cert, issuer_key_hash)
+    assert data[2:10] == timestamp_ms.to_bytes(8, "big")
@@ -0,0 +1,96 @@
+# Copyright 2024 The Sigstore Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+
+import pretend
+import pytest
+
+from sigstore import _cli
+from sigstore._internal.rekor.client import RekorClient
+from sigstore.verify.verifier import Verifier
+
+
+def _parse(*argv: str):
+    parser = _cli._parser()
+    args = parser.parse_args(argv)
+    args._parser = parser
+    return args
+
+
+def test_collect_verification_state_input_order(asset):
+    files = [asset("bundle_v3.txt"), asset("bundle.txt"), asset("bundle_v3_alt.txt")]
+    args = _parse(
+        "--staging",
+        "verify",
+        "identity",
+        "--offline",
+        "--cert-identity",
+        "x",
+        "--cert-oidc-issuer",
+        "y",
+        *map(str, files),
+    )
+
+    _, all_materials = _cli._collect_verification_state(args)
+
+    assert [file for file, _, _ in all_materials] == files
+    for file, hashed, _ in all_materials:
+        assert hashed.digest == hashlib.sha256(file.read_bytes()).digest()
+
+
+def test_collect_verification_state_no_log_entry(asset, monkeypatch, capsys):
+    # Detached materials are always looked up online; serve the lookup from a
+    # stub client instead, which finds no matching entry.
+    staging = Verifier.staging
+    monkeypatch.setattr(
+        Verifier, "staging", lambda *, offline=False: staging(offline=True)
+    )
+    post = pretend.call_recorder(lambda entry: None)
+    rekor = pretend.stub(
+        log=pretend.stub(entries=pretend.stub(retrieve=pretend.stub(post=post)))
+    )
+    with_session = pretend.call_recorder(lambda self, session: rekor)
+    monkeypatch.setattr(RekorClient, "_with_session", with_session)
+    session = pretend.stub(close=pretend.call_recorder(lambda: None))
+    monkeypatch.setattr(_cli, "_new_rekor_session", lambda: session)
+
+    file = asset("a.txt")
+    args = _parse(
+        "--staging",
+        "verify",
+        "identity",
+        "--cert-identity",
+        "x",
+        "--cert-oidc-issuer",
+        "y",
+        "--certificate",
+        str(asset("a.txt.crt")),
+        "--signature",
+        str(asset("a.txt.sig")),
+        str(file),
+    )
+
+    with pytest.raises(SystemExit):
+        _cli._collect_verification_state(args)
+
+    # The lookup happens through a per-worker session, and the failure is
+    # reported exactly once.
+    assert len(with_session.calls) == 1
+    assert with_session.calls[0].args[1] is session
+    assert len(post.calls) == 1
+    assert capsys.readouterr().err.count("No matching log entry") == 1
+
+    # The worker's session is closed, even on the error exit path.
+    assert session.close.calls == [pretend.call()]
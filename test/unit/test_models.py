@@ -50,6 +50,21 @@ class TestLogEntry:
             == bundle.log_entry
         )
 
+    def test_encode_canonical(self, signing_bundle):
+        _, bundle = signing_bundle("bundle.txt")
+        entry = bundle.log_entry
+
+        canonical = entry.encode_canonical()
+        assert json.loads(canonical) == {
+            "body": entry.body,
+            "integratedTime": entry.integrated_time,
+            "logID": entry.log_id,
+            "logIndex": entry.log_index,
+        }
+
+        # Repeated encodings are memoized.
+        assert entry.encode_canonical() is canonical
+
 
 class TestLogInclusionProof:
     def test_valid(self):
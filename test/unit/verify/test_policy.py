@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import re
+import weakref
 
 import pretend
 import pytest
@@ -21,11 +22,41 @@ from cryptography.x509 import ExtensionNotFound
 from sigstore.errors import VerificationError
 from sigstore.verify import policy
 
+# A placeholder certificate, for policies that never inspect it.
+_STUB = pretend.stub()
+
+# The (identity, issuer) that `bundle.txt`'s signing certificate was issued for.
+_TNY_TOWN = ("a@tny.town", "https://github.com/login/oauth")
+
+
+def _verify_bundle_txt(signing_bundle, policy_, reason):
+    """
+    Verifies `bundle.txt`'s signing certificate against `policy_`, expecting
+    failure with `reason` (or success, if `reason` is `None`).
+    """
+    _, bundle = signing_bundle("bundle.txt")
+
+    if reason is None:
+        policy_.verify(bundle.signing_certificate)
+    else:
+        with pytest.raises(VerificationError, match=reason):
+            policy_.verify(bundle.signing_certificate)
+
 
 class TestVerificationPolicy:
     def test_does_not_init(self):
         with pytest.raises(TypeError, match="Can't instantiate abstract class"):
-            policy.VerificationPolicy(pretend.stub())
+            policy.VerificationPolicy(_STUB)
+
+
+class TestSlots:
+    def test_weakref(self):
+        for policy_ in [
+            policy.AnyOf([]),
+            policy.AllOf([]),
+            policy.Identity(identity="foo"),
+        ]:
+            assert weakref.ref(policy_)() is policy_
 
 
 class TestUnsafeNoOp:
@@ -34,7 +65,7 @@ class TestUnsafeNoOp:
         monkeypatch.setattr(policy, "_logger", logger)
 
         policy_ = policy.UnsafeNoOp()
-        policy_.verify(pretend.stub())
+        policy_.verify(_STUB)
         assert logger.warning.calls == [
             pretend.call(
                 "unsafe (no-op) verification policy used! no verification performed!"
@@ -47,34 +78,62 @@ class TestAnyOf:
         policy_ = policy.AnyOf([])
 
         with pytest.raises(VerificationError, match="0 of 0 policies succeeded"):
-            policy_.verify(pretend.stub())
+            policy_.verify(_STUB)
 
-    def test_fails_no_children_match(self, signing_bundle):
-        _, bundle = signing_bundle("bundle.txt")
+    @pytest.mark.parametrize(
+        ("children", "reason"),
+        [
+            pytest.param(
+                [("foo", "bar"), ("baz", "quux")],
+                "0 of 2 policies succeeded",
+                id="no-children-match",
+            ),
+            pytest.param(
+                [("foo", "bar"), ("baz", "quux"), _TNY_TOWN],
+                None,
+                id="succeeds",
+            ),
+        ],
+    )
+    def test_identities(self, signing_bundle, children, reason):
         policy_ = policy.AnyOf(
-            [
-                policy.Identity(identity="foo", issuer="bar"),
-                policy.Identity(identity="baz", issuer="quux"),
-            ]
+            [policy.Identity(identity=i, issuer=iss) for i, iss in children]
         )
+        _verify_bundle_txt(signing_bundle, policy_, reason)
 
-        with pytest.raises(VerificationError, match="0 of 2 policies succeeded"):
-            policy_.verify(bundle.signing_certificate)
-
-    def test_succeeds(self, signing_bundle):
-        _, bundle = signing_bundle("bundle.txt")
-        policy_ = policy.AnyOf(
-            [
-                policy.Identity(identity="foo", issuer="bar"),
-                policy.Identity(identity="baz", issuer="quux"),
-                policy.Identity(
-                    identity="a@tny.town",
-                    issuer="https://github.com/login/oauth",
-                ),
-            ]
+    def test_succeeds_fast(self):
+        failing = pretend.stub(
+            verify=pretend.call_recorder(pretend.raiser(VerificationError("nope")))
         )
+        succeeding = pretend.stub(verify=pretend.call_recorder(lambda cert: None))
+        unreached = pretend.stub(verify=pretend.call_recorder(lambda cert: None))
+        policy_ = policy.AnyOf([failing, succeeding, unreached])
 
-        policy_.verify(bundle.signing_certificate)
+        cert = _STUB
+        policy_.verify(cert)
+
+        assert failing.verify.calls == [pretend.call(cert)]
+        assert succeeding.verify.calls == [pretend.call(cert)]
+        assert unreached.verify.calls == []
+
+    def test_flattens_nested(self):
+        a, b, c = pretend.stub(), pretend.stub(), pretend.stub()
+        all_of = policy.AllOf([a])
+        policy_ = policy.AnyOf([policy.AnyOf([a, policy.AnyOf([b])]), all_of, c])
+
+        assert policy_._children == [a, b, all_of, c]
+
+    def test_does_not_flatten_subclass(self):
+        class _SubAnyOf(policy.AnyOf):
+            def verify(self, cert):
+                raise VerificationError("overridden")
+
+        sub = _SubAnyOf([policy.UnsafeNoOp()])
+        policy_ = policy.AnyOf([sub])
+
+        assert policy_._children == [sub]
+        with pytest.raises(VerificationError, match="0 of 1 policies succeeded"):
+            policy_.verify(_STUB)
 
 
 class TestAllOf:
@@ -82,7 +141,24 @@ class TestAllOf:
         policy_ = policy.AllOf([])
 
         with pytest.raises(VerificationError, match="no child policies to verify"):
-            policy_.verify(pretend.stub())
+            policy_.verify(_STUB)
+
+    @pytest.mark.parametrize(
+        ("children", "reason"),
+        [
+            pytest.param(
+                [("foo", "bar"), ("baz", "quux"), _TNY_TOWN],
+                "Certificate's OIDCIssuer does not match",
+                id="not-all-children-match",
+            ),
+            pytest.param([_TNY_TOWN, _TNY_TOWN], None, id="succeeds"),
+        ],
+    )
+    def test_identities(self, signing_bundle, children, reason):
+        policy_ = policy.AllOf(
+            [policy.Identity(identity=i, issuer=iss) for i, iss in children]
+        )
+        _verify_bundle_txt(signing_bundle, policy_, reason)
 
     def test_certificate_extension_not_found(self):
         policy_ = policy.AllOf([policy.Identity(identity="foo", issuer="bar")])
@@ -100,26 +176,36 @@ class TestAllOf:
         with pytest.raises(VerificationError, match=reason):
             policy_.verify(cert_)
 
-    def test_fails_not_all_children_match(self, signing_bundle):
-        _, bundle = signing_bundle("bundle.txt")
-        policy_ = policy.AllOf(
-            [
-                policy.Identity(identity="foo", issuer="bar"),
-                policy.Identity(identity="baz", issuer="quux"),
-                policy.Identity(
-                    identity="a@tny.town",
-                    issuer="https://github.com/login/oauth",
-                ),
-            ]
+    def test_fails_fast(self):
+        failing = pretend.stub(
+            verify=pretend.call_recorder(
+                pretend.raiser(VerificationError("first failure"))
+            )
         )
+        unreached = pretend.stub(verify=pretend.call_recorder(lambda cert: None))
+        policy_ = policy.AllOf([failing, unreached])
 
-        with pytest.raises(
-            VerificationError,
-            match="Certificate's OIDCIssuer does not match",
-        ):
-            policy_.verify(bundle.signing_certificate)
+        cert = _STUB
+        with pytest.raises(VerificationError, match="first failure"):
+            policy_.verify(cert)
 
-    def test_succeeds(self, signing_bundle):
+        assert failing.verify.calls == [pretend.call(cert)]
+        assert unreached.verify.calls == []
+
+    def test_flattens_nested(self):
+        a, b = pretend.stub(), pretend.stub()
+        any_of = policy.AnyOf([a])
+        policy_ = policy.AllOf([policy.AllOf([a, b]), any_of])
+
+        assert policy_._children == [a, b, any_of]
+
+    def test_nested_empty_fails(self):
+        policy_ = policy.AllOf([policy.AllOf([]), policy.UnsafeNoOp()])
+
+        with pytest.raises(VerificationError, match="no child policies to verify"):
+            policy_.verify(_STUB)
+
+    def test_shares_subject_alternative_names(self, signing_bundle):
         _, bundle = signing_bundle("bundle.txt")
         policy_ = policy.AllOf(
             [
@@ -134,22 +220,52 @@ class TestAllOf:
             ]
         )
 
+        policy._subject_alternative_names.cache_clear()
         policy_.verify(bundle.signing_certificate)
 
+        # Each child checks the certificate's SANs, but the set of them is
+        # only built once.
+        assert policy._subject_alternative_names.cache_info().misses == 1
+        assert policy._subject_alternative_names.cache_info().hits == 1
+
 
 class TestIdentity:
-    def test_fails_no_san_match(self, signing_bundle):
-        _, bundle = signing_bundle("bundle.txt")
+    @pytest.mark.parametrize(
+        ("identity", "reason"),
+        [
+            pytest.param(
+                "bad@ident.example.com",
+                "Certificate's SANs do not match",
+                id="no-san-match",
+            ),
+            pytest.param("a@tny.town", None, id="succeeds"),
+        ],
+    )
+    def test_identity(self, signing_bundle, identity, reason):
         policy_ = policy.Identity(
-            identity="bad@ident.example.com",
-            issuer="https://github.com/login/oauth",
+            identity=identity, issuer="https://github.com/login/oauth"
+        )
+        _verify_bundle_txt(signing_bundle, policy_, reason)
+
+    def test_checks_issuer_before_sans(self):
+        policy_ = policy.Identity(identity="foo", issuer="bar")
+        # No SAN extension at all: an issuer mismatch must be reported
+        # without ever looking for one.
+        cert_ = pretend.stub(
+            extensions=pretend.stub(
+                get_extension_for_oid=lambda oid: pretend.stub(
+                    value=pretend.stub(value=b"baz")
+                ),
+                get_extension_for_class=pretend.raiser(
+                    AssertionError("SANs should not be examined")
+                ),
+            )
         )
 
         with pytest.raises(
-            VerificationError,
-            match="Certificate's SANs do not match",
+            VerificationError, match="Certificate's OIDCIssuer does not match"
         ):
-            policy_.verify(bundle.signing_certificate)
+            policy_.verify(cert_)
 
 
 class TestSingleExtPolicy:
@@ -190,3 +306,24 @@ class TestSingleExtPolicy:
 
         policy_ = policy.AllOf(verification_policy_extensions)
         policy_.verify(bundle.signing_certificate)
+
+    @pytest.mark.parametrize(
+        ("policy_", "reason"),
+        [
+            (
+                policy.GitHubWorkflowTrigger("push"),
+                "Certificate's GitHubWorkflowTrigger does not match "
+                "(got 'release', expected 'push')",
+            ),
+            (
+                policy.OIDCBuildTrigger("push"),
+                "Certificate's OIDCBuildTrigger does not match "
+                "(got release, expected push)",
+            ),
+        ],
+    )
+    def test_fails_mismatch(self, signing_bundle, policy_, reason):
+        _, bundle = signing_bundle("bundle_v3_github.whl")
+
+        with pytest.raises(VerificationError, match=re.escape(reason)):
+            policy_.verify(bundle.signing_certificate)
@@ -15,6 +15,7 @@
 
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import pretend
@@ -24,8 +25,9 @@ import rfc3161_client
 from sigstore._internal.trust import CertificateAuthority
 from sigstore.dsse import StatementBuilder, Subject
 from sigstore.errors import VerificationError
-from sigstore.models import Bundle
+from sigstore.models import Bundle, LogEntry
 from sigstore.verify import policy
+from sigstore.verify import verifier as verifier_mod
 from sigstore.verify.verifier import Verifier
 
 
@@ -94,6 +96,70 @@ def test_verifier_bundle_offline(signing_bundle, null_policy, filename):
     verifier.verify_artifact(file.read_bytes(), bundle, null_policy)
 
 
+def test_verifier_bundle_offline_stream(signing_bundle, null_policy):
+    (file, bundle) = signing_bundle("bundle_v3.txt")
+
+    verifier = Verifier.staging(offline=True)
+    with file.open(mode="rb") as io:
+        verifier.verify_artifact(io, bundle, null_policy)
+
+
+def test_verifier_log_entry_verified_once(signing_bundle, null_policy, monkeypatch):
+    (file, bundle) = signing_bundle("bundle_v3.txt")
+
+    verifier = Verifier.staging(offline=True)
+
+    _verify = pretend.call_recorder(LogEntry._verify)
+    monkeypatch.setattr(LogEntry, "_verify", _verify)
+
+    verifier.verify_artifact(file.read_bytes(), bundle, null_policy)
+    verifier.verify_artifact(file.read_bytes(), bundle, null_policy)
+
+    assert len(_verify.calls) == 1
+
+
+def test_verifier_sct_verified_once(signing_bundle, null_policy, monkeypatch):
+    (file, bundle) = signing_bundle("bundle_v3.txt")
+
+    verifier = Verifier.staging(offline=True)
+
+    verify_sct = pretend.call_recorder(verifier_mod.verify_sct)
+    monkeypatch.setattr(verifier_mod, "verify_sct", verify_sct)
+
+    verifier.verify_artifact(file.read_bytes(), bundle, null_policy)
+    verifier.verify_artifact(file.read_bytes(), bundle, null_policy)
+
+    assert len(verify_sct.calls) == 1
+
+
+def test_verifier_remember_concurrent(monkeypatch):
+    monkeypatch.setattr(verifier_mod, "_MAX_VERIFIED_LOG_ENTRIES", 2)
+    verifier = Verifier.staging(offline=True)
+
+    def _remember_many(start: int) -> None:
+        for i in range(start, start + 1000):
+            verifier._remember(verifier._verified_log_entries, i.to_bytes(4, "big"))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_remember_many, range(0, 8000, 1000)))
+
+    assert len(verifier._verified_log_entries) <= 2
+
+
+def test_verifier_shared_across_threads(signing_bundle, null_policy):
+    (file, bundle) = signing_bundle("bundle_v3.txt")
+    input_ = file.read_bytes()
+
+    verifier = Verifier.staging(offline=True)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(
+            pool.map(
+                lambda _: verifier.verify_artifact(input_, bundle, null_policy),
+                range(8),
+            )
+        )
+
+
 @pytest.mark.staging
 def test_verifier_email_identity(signing_materials):
     verifier = Verifier.staging()